@@ -8,6 +8,9 @@ setup(
     install_requires=[
         "beautifulsoup4>=4.9.3",
         "httpx>=0.24.1",
+        "httpx[http2]",
         "httpx[socks]",
+        "lxml>=4.9.0",
+        "selectolax>=0.3.12",
     ],
 )
@@ -1,15 +1,43 @@
 # Standard Python libraries.
 import asyncio
 import logging
+import math
 import random
+import re
 import urllib
 
 # Third party Python libraries.
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml is much faster than Python's built-in html.parser, but fall back to it if lxml is not installed.
+try:
+    import lxml  # noqa: F401
+
+    BS4_PARSER = "lxml"
+except ImportError:
+    BS4_PARSER = "html.parser"
+
+# Only build BeautifulSoup objects for the search results and the top bar, skipping the rest of the page.
+BS4_SEARCH_STRAINER = SoupStrainer(id=["search", "gbar"])
+
+# selectolax's Lexbor parser is significantly faster than BeautifulSoup. BeautifulSoup is only used if selectolax is not
+# installed or html_parser="bs4" is passed to SearchClient.
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 
 # Custom Python libraries.
 
+# Extract the destination URL from Google's "/url?" links. The "q" parameter exists most of the time, but sometimes only
+# the "url" parameter does. Blank values are skipped, like urllib.parse.parse_qs() does.
+URL_Q_PARAMETER_REGEX = re.compile(r"[?&]q=([^&#]+)")
+URL_URL_PARAMETER_REGEX = re.compile(r"[?&]url=([^&#]+)")
+
+# Extract the netloc of a URL, like urllib.parse.urlparse() does, without building a ParseResult.
+URL_NETLOC_REGEX = re.compile(r"^(?:[A-Za-z][A-Za-z0-9+.-]*:)?//([^/?#]*)")
+
 
 def get_tbs(from_date, to_date):
     """Helper function to format the tbs parameter dates. Note that verbatim mode also uses the &tbs= parameter, but
@@ -45,16 +73,20 @@ class SearchClient:
         extra_params=None,
         max_search_result_urls_to_return=100,
         minimum_delay_between_paged_results_in_seconds=7,
+        concurrent_pages=1,
         user_agent=None,
         manages_http_429s=True,
         http_429_cool_off_time_in_minutes=60,
         http_429_cool_off_factor=1.1,
+        max_http_429_retries=None,
         proxy="",
         verify_ssl=True,
+        http2=True,
         verbosity=5,
         verbose_output=False,
         google_exemption=None,
         logger=None,
+        html_parser="selectolax",
     ) -> None:
         """
         SearchClient
@@ -75,27 +107,34 @@ class SearchClient:
         :param int max_search_result_urls_to_return: Max URLs to return for the entire Google search.
         :param int minimum_delay_between_paged_results_in_seconds: Minimum time to wait between HTTP requests for
             consecutive pages for the same search query. The actual time will be a random value between this minimum
-            value and value + 11 to make it look more human.
+            value and value + 10 to make it look more human.
+        :param int concurrent_pages: Number of result pages to request concurrently once the first page has returned
+            results. The delay between paged results is applied per batch of pages. Defaults to 1 (sequential).
         :param str user_agent: Hard-coded user agent for the HTTP requests.
         :param bool manages_http_429s: Determines if googleserp will handle HTTP 429 cool off and
            retries. Disable if you want to manage HTTP 429 responses.
         :param int http_429_cool_off_time_in_minutes: Minutes to sleep if an HTTP 429 is detected.
         :param float http_429_cool_off_factor: Factor to multiply by http_429_cool_off_time_in_minutes for each HTTP 429
             detected.
+        :param int max_http_429_retries: Max number of times to retry a request after an HTTP 429 is detected. Once
+            reached, "HTTP_429_DETECTED" is returned like with manages_http_429s=False. Defaults to None (no limit).
         :param str proxy: HTTP(S) or SOCKS5 proxy to use.
         :param bool verify_ssl: Verify the SSL certificate to prevent traffic interception attacks. Defaults to True.
             This may need to be disabled in some HTTPS proxy instances.
+        :param bool http2: Use HTTP/2 for the requests. Defaults to True. Disable it if Google blocks HTTP/2 clients.
         :param int verbosity: Logging and console output verbosity.
         :param bool verbose_output: False (only URLs) or True (rank, title, description, and URL). Defaults to False.
         :param str google_exemption: Google cookie exemption string. This is a string that Google uses to allow certain
             google searches. Defaults to None.
         :param logging.Logger logger: Logger object to use. Defaults to None.
+        :param str html_parser: HTML parser used to extract the search results, "selectolax" or "bs4" (BeautifulSoup).
+            Defaults to "selectolax".
 
         :rtype: List of str
         :return: List of URLs found or list of {"rank", "title", "description", "url"}
         """
 
-        self.query = urllib.parse.quote_plus(query)
+        self.query = query
         self.tld = tld
         self.lang_html_ui = lang_html_ui
         self.lang_result = lang_result.lower()
@@ -107,15 +146,19 @@ class SearchClient:
         self.extra_params = extra_params
         self.max_search_result_urls_to_return = max_search_result_urls_to_return
         self.minimum_delay_between_paged_results_in_seconds = minimum_delay_between_paged_results_in_seconds
+        self.concurrent_pages = concurrent_pages
         self.user_agent = user_agent
         self.manages_http_429s = manages_http_429s
         self.http_429_cool_off_time_in_minutes = http_429_cool_off_time_in_minutes
         self.http_429_cool_off_factor = http_429_cool_off_factor
+        self.max_http_429_retries = max_http_429_retries
         self.proxy = proxy
         self.verify_ssl = verify_ssl
+        self.http2 = http2
         self.verbosity = verbosity
         self.verbose_output = verbose_output
         self.google_exemption = google_exemption
+        self.html_parser = html_parser
 
         self.logger = logger
 
@@ -133,6 +176,17 @@ class SearchClient:
             self.logger.warning("The largest value allowed by Google for num is 100. Setting num to 100.")
             self.num = 100
 
+        if self.html_parser not in ("selectolax", "bs4"):
+            raise ValueError(f'Unsupported html_parser "{self.html_parser}", use "selectolax" or "bs4"')
+
+        if self.html_parser == "selectolax" and not LexborHTMLParser:
+            self.logger.warning("selectolax is not installed. Setting html_parser to bs4.")
+            self.html_parser = "bs4"
+
+        if self.concurrent_pages < 1:
+            self.logger.warning("The smallest value allowed for concurrent_pages is 1. Setting concurrent_pages to 1.")
+            self.concurrent_pages = 1
+
         if 400 < self.max_search_result_urls_to_return:
             self.logger.warning(
                 "googleserp is usually only able to retrieve a maximum of ~400 results. See README for more details."
@@ -164,52 +218,74 @@ class SearchClient:
         if not user_agent:
             self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.131 Safari/537.36"
 
-        # Update the URLs with the initial SearchClient attributes.
+        # If no extra_params is given, create an empty dictionary. We should avoid using an empty dictionary as a
+        # default value in a function parameter in Python.
+        if not self.extra_params:
+            self.extra_params = {}
+
+        # Check extra_params for overlapping parameters.
+        for builtin_param in self.url_parameters:
+            if builtin_param in self.extra_params.keys():
+                raise ValueError(f'GET parameter "{builtin_param}" is overlapping with the built-in GET parameter')
+
+        # Build the URLs with the initial SearchClient attributes.
         self.update_urls()
 
-        # Initialize proxy_dict.
-        self.proxy_dict = {}
+        # HTTP client shared by all the requests of a search. Created on the first get_page() call.
+        self._client = None
 
-        # Update proxy_dict if a proxy is provided.
-        if proxy:
-            self.proxy_dict = {
-                "http://": self.proxy,
-                "https://": self.proxy,
-            }
+        # Concurrent page requests can all be blocked by the same HTTP 429 event. The lock, created by get_page(),
+        # makes them wait for a single cool off, and the counter tells a request whether one already happened since it
+        # was sent.
+        self._http_429_lock = None
+        self._http_429_cool_offs = 0
 
     def update_urls(self) -> None:
-        """Update search URLs being used."""
+        """Update search URLs being used. Only the GET parameters that depend on the page are left to _build_url()."""
+
+        # Extra GET parameters appended to every search URL. The keys and values are not URL encoded.
+        extra_params = "".join(f"&{key}={value}" for key, value in self.extra_params.items())
 
         # URL templates to make Google searches.
         self.url_home = f"https://www.google.{self.tld}/"
 
-        # First search requesting the default 10 search results.
-        self.url_search = (
-            f"https://www.google.{self.tld}/search?hl={self.lang_html_ui}&lr={self.lang_result}&"
-            f"q={self.query}&btnG=Google+Search&tbs={self.tbs}&safe={self.safe}&"
-            f"cr={self.country}&filter=0"
+        # GET parameters shared by every search URL, URL encoded once.
+        search_params = urllib.parse.urlencode(
+            [
+                ("hl", self.lang_html_ui),
+                ("lr", self.lang_result),
+                ("q", self.query),
+                ("tbs", self.tbs),
+                ("safe", self.safe),
+                ("cr", self.country),
+                ("filter", "0"),
+            ],
+            quote_via=urllib.parse.quote_plus,
         )
+        self.url_search_base = f"https://www.google.{self.tld}/search?{search_params}{extra_params}"
 
-        # Subsequent searches starting at &start= and retrieving 10 search results at a time.
-        self.url_next_page = (
-            f"https://www.google.{self.tld}/search?hl={self.lang_html_ui}&lr={self.lang_result}&"
-            f"q={self.query}&start={self.start}&tbs={self.tbs}&safe={self.safe}&"
-            f"cr={self.country}&filter=0"
-        )
+    def _build_url(self, start):
+        """Return the search URL for the page of results beginning at start.
 
-        # First search requesting more than the default 10 search results.
-        self.url_search_num = (
-            f"https://www.google.{self.tld}/search?hl={self.lang_html_ui}&lr={self.lang_result}&"
-            f"q={self.query}&num={self.num}&btnG=Google+Search&tbs={self.tbs}&"
-            f"safe={self.safe}&cr={self.country}&filter=0"
-        )
+        :param int start: Index of the first search result on the page.
 
-        # Subsequent searches starting at &start= and retrieving &num= search results at a time.
-        self.url_next_page_num = (
-            f"https://www.google.{self.tld}/search?hl={self.lang_html_ui}&lr={self.lang_result}&"
-            f"q={self.query}&start={self.start}&num={self.num}&tbs={self.tbs}&"
-            f"safe={self.safe}&cr={self.country}&filter=0"
-        )
+        :rtype: str
+        :return: Search URL
+        """
+
+        page_params = {}
+
+        # Google returns 10 search results by default.
+        if self.num != 10:
+            page_params["num"] = self.num
+
+        # The first search comes from the search button, subsequent searches start at &start=.
+        if start:
+            page_params["start"] = start
+        else:
+            page_params["btnG"] = "Google Search"
+
+        return f"{self.url_search_base}&{urllib.parse.urlencode(page_params)}"
 
     def filter_search_result_urls(self, link):
         """Filter links found in the Google result pages HTML code. Valid results are absolute URLs not pointing to a
@@ -220,43 +296,151 @@ class SearchClient:
         :return: URL string
         """
 
-        self.logger.debug(f"pre filter_search_result_urls() link: {link}")
+        # This runs for every anchor on every page, so let the logger format the messages only if they are emitted.
+        self.logger.debug("pre filter_search_result_urls() link: %s", link)
 
         try:
             # Extract URL from parameter. Once in a while the full "http://www.google.com/url?" exists instead of just
             # "/url?". After a re-run, it disappears and "/url?" is present...might be a caching thing?
-            if link.startswith("/url?") or link.startswith("http://www.google.com/url?"):
-                urlparse_object = urllib.parse.urlparse(link, scheme="http")
-
-                # The "q" key exists most of the time.
-                try:
-                    link = urllib.parse.parse_qs(urlparse_object.query)["q"][0]
-                # Sometimes, only the "url" key does though.
-                except KeyError:
-                    link = urllib.parse.parse_qs(urlparse_object.query)["url"][0]
-
-            # Create a urlparse object.
-            urlparse_object = urllib.parse.urlparse(link, scheme="http")
-
-            # Exclude urlparse objects without a netloc value.
-            if not urlparse_object.netloc:
-                self.logger.debug(
-                    f"Excluding URL because it does not contain a urllib.parse.urlparse netloc value: {link}"
-                )
+            if link.startswith(("/url?", "http://www.google.com/url?")):
+                # The "q" key exists most of the time. Sometimes, only the "url" key does though.
+                url_parameter_match = URL_Q_PARAMETER_REGEX.search(link) or URL_URL_PARAMETER_REGEX.search(link)
+                link = urllib.parse.unquote_plus(url_parameter_match.group(1)) if url_parameter_match else None
+
+            netloc_match = URL_NETLOC_REGEX.match(link) if link else None
+            netloc = netloc_match.group(1) if netloc_match else ""
+
+            # Exclude URLs without a netloc value.
+            if not netloc:
+                self.logger.debug("Excluding URL because it does not contain a netloc value: %s", link)
                 link = None
 
             # TODO: Generates false positives if specifying an actual Google site, e.g. "site:google.com fiber".
-            if urlparse_object.netloc and ("google" in urlparse_object.netloc.lower()):
-                self.logger.debug(f'Excluding URL because it contains "google": {link}')
+            elif "google" in netloc.lower():
+                self.logger.debug('Excluding URL because it contains "google": %s', link)
                 link = None
 
         except Exception:
             link = None
 
-        self.logger.debug(f"post filter_search_result_urls() link: {link}")
+        self.logger.debug("post filter_search_result_urls() link: %s", link)
 
         return link
 
+    def parse_page(self, html):
+        """Extract the search results from a Google result page.
+
+        :param bytes html: Web page HTML retrieved by get_page().
+
+        :rtype: List of tuples
+        :return: List of (url, title, description) tuples for every valid link found. The title and description are
+            empty strings unless verbose_output is True.
+        """
+
+        if self.html_parser == "selectolax":
+            return self.parse_page_selectolax(html)
+
+        return self.parse_page_bs4(html)
+
+    def parse_page_selectolax(self, html):
+        """Extract the search results from a Google result page using selectolax. See parse_page()."""
+
+        tree = LexborHTMLParser(html)
+
+        # Find all HTML <a> elements with an href in a single query.
+        anchors = tree.css("#search a[href]")
+
+        # Sometimes (depending on the User-Agent) there is no id "search" in html response.
+        if not anchors and tree.css_first("#search") is None:
+            # Remove links from the top bar.
+            gbar = tree.css_first("#gbar")
+            if gbar is not None:
+                gbar.decompose()
+            anchors = tree.css("a[href]")
+
+        results = []
+
+        # Process every anchored URL.
+        for a in anchors:
+            # Filter invalid links and links pointing to Google itself.
+            link = self.filter_search_result_urls(a.attributes["href"])
+            if not link:
+                continue
+
+            title = ""
+            description = ""
+
+            if self.verbose_output:
+                # Extract the URL title, which is in an <h3> inside the anchor when Google adds the displayed URL too.
+                title_node = a.css_first("h3")
+                title = (title_node or a).text()
+
+                # Extract the URL description from the first element after the anchor's parent that contains text.
+                # Google returns different structures, so the description isn't always the next element.
+                sibling = a.parent.next
+                while sibling is not None and not description.strip():
+                    if sibling.tag != "-text":
+                        description = sibling.text()
+                    sibling = sibling.next
+
+                if not description.strip():
+                    self.logger.warning("No description for link: %s", link)
+
+            results.append((link, title, description))
+
+        return results
+
+    def parse_page_bs4(self, html):
+        """Extract the search results from a Google result page using BeautifulSoup. See parse_page()."""
+
+        # Create the BeautifulSoup object, only parsing the search results.
+        soup = BeautifulSoup(html, BS4_PARSER, parse_only=BS4_SEARCH_STRAINER, from_encoding="utf-8")
+
+        # Find all HTML <a> elements with an href in a single query.
+        anchors = soup.select("#search a[href]")
+
+        # Sometimes (depending on the User-Agent) there is no id "search" in html response.
+        if not anchors and soup.find(id="search") is None:
+            # The links are somewhere else on the page, so parse all of it.
+            soup = BeautifulSoup(html, BS4_PARSER, from_encoding="utf-8")
+
+            # Remove links from the top bar.
+            gbar = soup.find(id="gbar")
+            if gbar:
+                gbar.clear()
+            anchors = soup.select("a[href]")
+
+        results = []
+
+        # Process every anchored URL.
+        for a in anchors:
+            # Filter invalid links and links pointing to Google itself.
+            link = self.filter_search_result_urls(a["href"])
+            if not link:
+                continue
+
+            title = ""
+            description = ""
+
+            if self.verbose_output:
+                # Extract the URL title, which is in an <h3> inside the anchor when Google adds the displayed URL too.
+                title_tag = a.find("h3")
+                title = (title_tag or a).get_text()
+
+                # Extract the URL description from the first element after the anchor's parent that contains text.
+                # Google returns different structures, so the description isn't always the next element.
+                sibling = a.parent.find_next_sibling()
+                while sibling is not None and not description.strip():
+                    description = sibling.get_text()
+                    sibling = sibling.find_next_sibling()
+
+                if not description.strip():
+                    self.logger.warning("No description for link: %s", link)
+
+            results.append((link, title, description))
+
+        return results
+
     def http_429_detected(self) -> None:
         """Increase the HTTP 429 cool off period."""
 
@@ -270,26 +454,62 @@ class SearchClient:
         )
         self.http_429_cool_off_time_in_minutes = new_http_429_cool_off_time_in_minutes
 
+    async def aclose(self) -> None:
+        """Close the HTTP client and its pooled connections."""
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+        # A later search may run on a different event loop.
+        self._http_429_lock = None
+
     async def get_page(self, url):
         """Request the given URL and return the response page.
 
         :param str url: URL to retrieve.
 
-        :rtype: str
-        :return: Web page HTML retrieved for the given URL
+        :rtype: bytes
+        :return: Web page HTML retrieved for the given URL, UTF-8 encoded
         """
 
         headers = {
             "User-Agent": self.user_agent,
         }
 
-        self.logger.info(f"Requesting URL: {url}")
+        # Reuse the same HTTP client, and its connection pool, for every request in the search. Every request goes to
+        # the same Google host, so a small pool of long-lived keep-alive connections is enough. The proxy, if any, is
+        # set on the transport so that the tuned transport is used for all of the traffic.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                cookies=self.cookies,
+                transport=httpx.AsyncHTTPTransport(
+                    verify=self.verify_ssl,
+                    http2=self.http2,
+                    limits=httpx.Limits(max_keepalive_connections=4, max_connections=8, keepalive_expiry=60),
+                    proxy=httpx.Proxy(self.proxy) if self.proxy else None,
+                    retries=1,
+                ),
+                timeout=15,
+            )
+
+        # Created here rather than in __init__() so the lock belongs to the running event loop.
+        if self._http_429_lock is None:
+            self._http_429_lock = asyncio.Lock()
 
-        async with httpx.AsyncClient(proxies=self.proxy_dict, cookies=self.cookies, verify=self.verify_ssl) as client:
-            response = await client.get(url, headers=headers, timeout=15)
+        # Number of times the request has been retried after an HTTP 429.
+        http_429_retries = 0
 
-            # Update the cookies.
-            self.cookies = response.cookies
+        while True:
+            self.logger.info(f"Requesting URL: {url}")
+
+            # HTTP 429 cool offs completed before this request was sent.
+            http_429_cool_offs = self._http_429_cool_offs
+
+            response = await self._client.get(url, headers=headers)
+
+            # Update the cookies. The client's cookie jar persists them between requests.
+            self.cookies = self._client.cookies
 
             # Extract the HTTP response code.
             http_response_code = response.status_code
@@ -300,14 +520,15 @@ class SearchClient:
             self.logger.debug(f"    cookies: {self.cookies}")
             self.logger.debug(f"    proxy: {self.proxy}")
             self.logger.debug(f"    verify_ssl: {self.verify_ssl}")
+            self.logger.debug(f"    http_version: {response.http_version}")
 
             # Google throws up a consent page for searches sourcing from a European Union country IP location.
             # See https://github.com/benbusby/whoogle-search/issues/311
             try:
                 if response.cookies["CONSENT"].startswith("PENDING+"):
                     self.logger.warning(
-                        "Looks like your IP address is sourcing from a European Union location...your search results may "
-                        "vary, but I'll try and work around this by updating the cookie."
+                        "Looks like your IP address is sourcing from a European Union location...your search results "
+                        "may vary, but I'll try and work around this by updating the cookie."
                     )
 
                     # Convert the cookiejar data structure to a Python dict.
@@ -330,7 +551,8 @@ class SearchClient:
                         https://github.com/benbusby/whoogle-search/issues/311#issuecomment-841065630
                     XYZ - Random 3-digit number assigned to the first response cookie.
                     """
-                    self.cookies = {"CONSENT": f"YES+shp.gws-20211108-0-RC1.fr+F+{number}"}
+                    self._client.cookies = {"CONSENT": f"YES+shp.gws-20211108-0-RC1.fr+F+{number}"}
+                    self.cookies = self._client.cookies
 
                     self.logger.info(f"Updating cookie to: {self.cookies}")
 
@@ -338,10 +560,18 @@ class SearchClient:
             except KeyError:
                 pass
 
-            html = ""
+            html = b""
 
             if http_response_code == 200:
-                html = response.text
+                # Hand the raw bytes to the HTML parser, which decodes them as UTF-8. Google returns UTF-8, so only the
+                # rare page declaring another charset in the Content-Type header is transcoded.
+                html = response.content
+                charset = response.charset_encoding
+                if charset and charset.lower() not in ("utf-8", "utf8"):
+                    try:
+                        html = html.decode(charset, "replace").encode("utf-8")
+                    except LookupError:
+                        self.logger.warning(f"Unknown charset: {charset}")
 
             elif http_response_code == 429:
                 self.logger.warning(
@@ -354,181 +584,148 @@ class SearchClient:
                     self.logger.info("Since manages_http_429s=False, googleserp is done.")
                     return "HTTP_429_DETECTED"
 
-                self.logger.info(f"Sleeping for {self.http_429_cool_off_time_in_minutes} minutes...")
-                await asyncio.sleep(self.http_429_cool_off_time_in_minutes * 60)
-                self.http_429_detected()
+                if self.max_http_429_retries is not None and http_429_retries >= self.max_http_429_retries:
+                    self.logger.info(f"Reached max_http_429_retries={self.max_http_429_retries}, googleserp is done.")
+                    return "HTTP_429_DETECTED"
+
+                async with self._http_429_lock:
+                    # Only cool off if another concurrent request hasn't already done so for this HTTP 429 event.
+                    if http_429_cool_offs == self._http_429_cool_offs:
+                        self.logger.info(f"Sleeping for {self.http_429_cool_off_time_in_minutes} minutes...")
+                        await asyncio.sleep(self.http_429_cool_off_time_in_minutes * 60)
+                        self.http_429_detected()
+                        self._http_429_cool_offs += 1
 
-                # Try making the request again.
-                html = await self.get_page(url)
+                # Try making the request again, reusing the same client.
+                http_429_retries += 1
+                continue
 
             else:
                 self.logger.warning(f"HTML response code: {http_response_code}")
 
-        return html
-
-    async def search(self):
-        """Start the Google search.
-
-        :rtype: List of str
-        :return: List of URLs found or list of {"rank", "title", "description", "url"}
-        """
-
-        # Consolidate search results.
-        self.search_result_list = []
+            return html
 
-        # Count the number of valid, non-duplicate links found.
-        total_valid_links_found = 0
+    async def get_search_results(self, url):
+        """Request a Google result page and extract its search results.
 
-        # If no extra_params is given, create an empty dictionary. We should avoid using an empty dictionary as a
-        # default value in a function parameter in Python.
-        if not self.extra_params:
-            self.extra_params = {}
-
-        # Check extra_params for overlapping parameters.
-        for builtin_param in self.url_parameters:
-            if builtin_param in self.extra_params.keys():
-                raise ValueError(f'GET parameter "{builtin_param}" is overlapping with the built-in GET parameter')
+        :param str url: Search URL to retrieve.
 
-        # Simulates browsing to the https://www.google.com home page and retrieving the initial cookie.
-        html = await self.get_page(self.url_home)
-
-        # Loop until we reach the maximum result results found or there are no more search results found to reach
-        # max_search_result_urls_to_return.
-        while total_valid_links_found <= self.max_search_result_urls_to_return:
-            self.logger.info(
-                f"Stats: start={self.start}, num={self.num}, total_valid_links_found={total_valid_links_found} / "
-                f"max_search_result_urls_to_return={self.max_search_result_urls_to_return}"
-            )
+        :rtype: List of tuples or str
+        :return: List of (url, title, description) tuples, see parse_page(), or "HTTP_429_DETECTED"
+        """
 
-            # Prepare the URL for the search request.
-            if self.start:
-                if self.num == 10:
-                    url = self.url_next_page
-                else:
-                    url = self.url_next_page_num
-            else:
-                if self.num == 10:
-                    url = self.url_search
-                else:
-                    url = self.url_search_num
+        html = await self.get_page(url)
 
-            # Append extra GET parameters to the URL. This is done on every iteration because we're rebuilding the
-            # entire URL at the end of this loop. The keys and values are not URL encoded.
-            for key, value in self.extra_params.items():
-                url += f"&{key}={value}"
+        if html == "HTTP_429_DETECTED":
+            return html
 
-            # Request Google search results.
-            html = await self.get_page(url)
+        # Parse the page in a worker thread, so the HTML parsing doesn't block the event loop and overlaps with the
+        # requests for the other pages.
+        return await asyncio.get_event_loop().run_in_executor(None, self.parse_page, html)
 
-            # HTTP 429 message returned from get_page() function, add "HTTP_429_DETECTED" to the set and return to the
-            # calling script.
-            if html == "HTTP_429_DETECTED":
-                self.search_result_list.append("HTTP_429_DETECTED")
-                return self.search_result_list
+    async def search(self):
+        """Start the Google search.
 
-            # Create the BeautifulSoup object.
-            soup = BeautifulSoup(html, "html.parser")
+        :rtype: List of str
+        :return: List of URLs found or list of {"rank", "title", "description", "url"}
+        """
 
-            # Find all HTML <a> elements.
-            try:
-                anchors = soup.find(id="search").find_all("a")
-            # Sometimes (depending on the User-Agent) there is no id "search" in html response.
-            except AttributeError:
-                # Remove links from the top bar.
-                gbar = soup.find(id="gbar")
-                if gbar:
-                    gbar.clear()
-                anchors = soup.find_all("a")
-
-            # Tracks number of valid URLs found on a search page.
-            valid_links_found_in_this_search = 0
-
-            # Process every anchored URL.
-            for a in anchors:
-                # Get the URL from the anchor tag.
-                try:
-                    link = a["href"]
-                except KeyError:
-                    self.logger.warning(f"No href for link: {link}")
-                    continue
-
-                # Filter invalid links and links pointing to Google itself.
-                link = self.filter_search_result_urls(link)
-                if not link:
-                    continue
-
-                if self.verbose_output:
-                    # Extract the URL title.
-                    try:
-                        title = a.get_text()
-                    except Exception:
-                        self.logger.warning(f"No title for link: {link}")
-                        title = ""
+        try:
+            # Consolidate search results, keyed by URL to detect duplicates. Dictionaries preserve insertion order, so
+            # the values are the results in the order they were found.
+            self._results = {}
+
+            # Count the number of valid, non-duplicate links found.
+            total_valid_links_found = 0
+
+            # Simulates browsing to the https://www.google.com home page and retrieving the initial cookie.
+            html = await self.get_page(self.url_home)
+
+            # Only request the first page on its own, to confirm there are search results before requesting pages
+            # concurrently.
+            pages_to_request = 1
+
+            # Loop until we reach the maximum result results found or there are no more search results found to reach
+            # max_search_result_urls_to_return.
+            while total_valid_links_found <= self.max_search_result_urls_to_return:
+                self.logger.info(
+                    f"Stats: start={self.start}, num={self.num}, total_valid_links_found={total_valid_links_found} / "
+                    f"max_search_result_urls_to_return={self.max_search_result_urls_to_return}"
+                )
 
-                    # Extract the URL description.
-                    try:
-                        description = a.parent.parent.contents[1].get_text()
-
-                        # Sometimes Google returns different structures.
-                        if description == "":
-                            description = a.parent.parent.contents[2].get_text()
-
-                    except Exception:
-                        self.logger.warning(f"No description for link: {link}")
-                        description = ""
-
-                # Check if URL has already been found.
-                if link not in self.search_result_list:
-                    # Increase the counters.
-                    valid_links_found_in_this_search += 1
-                    total_valid_links_found += 1
-
-                    self.logger.info(f"Found unique URL #{total_valid_links_found}: {link}")
-
-                    if self.verbose_output:
-                        self.search_result_list.append(
-                            {
-                                "rank": total_valid_links_found,  # Approximate rank according to googleserp.
-                                "title": title.strip(),  # Remove leading and trailing spaces.
-                                "description": description.strip(),  # Remove leading and trailing spaces.
-                                "url": link,
-                            }
-                        )
-                    else:
-                        self.search_result_list.append(link)
-
-                else:
-                    self.logger.info(f"Duplicate URL found: {link}")
-
-                # If we reached the limit of requested URLs, return with the results.
-                if self.max_search_result_urls_to_return <= len(self.search_result_list):
-                    return self.search_result_list
-
-            # Determining if a "Next" URL page of results is not straightforward. If no valid links are found, the
-            # search results have been exhausted.
-            if valid_links_found_in_this_search == 0:
-                self.logger.info("No valid search results found on this page. Moving on...")
-                return self.search_result_list
-
-            # Bump the starting page URL parameter for the next request.
-            self.start += self.num
-
-            # Refresh the URLs.
-            self.update_urls()
-
-            # If self.num == 10, this is the default search criteria.
-            if self.num == 10:
-                url = self.url_next_page
-            # User has specified search criteria requesting more than 10 results at a time.
-            else:
-                url = self.url_next_page_num
+                # Don't request more pages than are needed to reach max_search_result_urls_to_return, but always request
+                # at least one.
+                pages_to_request = max(
+                    1,
+                    min(
+                        pages_to_request,
+                        math.ceil((self.max_search_result_urls_to_return - total_valid_links_found) / self.num),
+                    ),
+                )
 
-            # Randomize sleep time between paged requests to make it look more human.
-            random_sleep_time = random.choice(
-                range(
+                # Request Google search results. Pagination is deterministic, so the next pages can be requested
+                # concurrently and processed in order.
+                urls = [self._build_url(self.start + page * self.num) for page in range(pages_to_request)]
+                pages = await asyncio.gather(*(self.get_search_results(url) for url in urls))
+
+                for search_results in pages:
+                    # HTTP 429 message returned from get_page() function, add "HTTP_429_DETECTED" to the set and return
+                    # to the calling script.
+                    if search_results == "HTTP_429_DETECTED":
+                        return list(self._results.values()) + ["HTTP_429_DETECTED"]
+
+                    # Tracks number of valid URLs found on a search page.
+                    valid_links_found_in_this_search = 0
+
+                    # Process every valid URL found on the page.
+                    for link, title, description in search_results:
+                        # Check if URL has already been found.
+                        if link not in self._results:
+                            # Increase the counters.
+                            valid_links_found_in_this_search += 1
+                            total_valid_links_found += 1
+
+                            self.logger.info("Found unique URL #%s: %s", total_valid_links_found, link)
+
+                            if self.verbose_output:
+                                self._results[link] = {
+                                    "rank": total_valid_links_found,  # Approximate rank according to googleserp.
+                                    "title": title.strip(),  # Remove leading and trailing spaces.
+                                    "description": description.strip(),  # Remove leading and trailing spaces.
+                                    "url": link,
+                                }
+                            else:
+                                self._results[link] = link
+
+                        else:
+                            self.logger.info("Duplicate URL found: %s", link)
+
+                        # If we reached the limit of requested URLs, return with the results.
+                        if self.max_search_result_urls_to_return <= len(self._results):
+                            return list(self._results.values())
+
+                    # Determining if a "Next" URL page of results is not straightforward. If no valid links are found,
+                    # the search results have been exhausted.
+                    if valid_links_found_in_this_search == 0:
+                        self.logger.info("No valid search results found on this page. Moving on...")
+                        return list(self._results.values())
+
+                    # Bump the starting page URL parameter for the next request.
+                    self.start += self.num
+
+                # The search returned results, so request the next pages concurrently.
+                pages_to_request = self.concurrent_pages
+
+                # Randomize sleep time between paged requests to make it look more human.
+                random_sleep_time = random.uniform(
                     self.minimum_delay_between_paged_results_in_seconds,
-                    self.minimum_delay_between_paged_results_in_seconds + 11,
+                    self.minimum_delay_between_paged_results_in_seconds + 10,
                 )
-            )
-            self.logger.info(f"Sleeping {random_sleep_time} seconds until retrieving the next page of results...")
-            await asyncio.sleep(random_sleep_time)
+                self.logger.info(
+                    f"Sleeping {random_sleep_time:.2f} seconds until retrieving the next page of results..."
+                )
+                await asyncio.sleep(random_sleep_time)
+
+        finally:
+            # Close the HTTP client once the search is done.
+            await self.aclose()